@@ -1,5 +1,4 @@
 import os
-import re
 from datetime import datetime
 from enum import Enum, IntFlag
 from pathlib import Path
@@ -12,9 +11,12 @@ from typing_extensions import LiteralString
 WOX_SDK_PATH = 'D:/apps/utils/ergo/wox/JsonRPC'
 
 MIN_QUERY_LENGTH    = 1
+SHORT_QUERY_LENGTH  = 3  # token ratio is noise at this length, skip it
 MAX_MISSING_LETTERS = 1
 MAX_RATE_FOR_RESULT = 15
+MIN_TOKEN_SORT_RATIO = 40  # scorer may early-exit below this
 MAX_RESULTS_COUNT   = 15
+CACHE_TTL           = 60  # seconds, answers are invalidated by run counts anyway
 ENABLED_EXTENSIONS          = ('exe', 'bat', 'cmd', 'lnk', 'chm', 'cpl')
 
 #
@@ -22,6 +24,7 @@ ENABLED_EXTENSIONS          = ('exe', 'bat', 'cmd', 'lnk', 'chm', 'cpl')
 FILE = Path(__file__)
 ARCH: int = 64 if 'PROGRAMFILES(X86)' in os.environ else 32
 DLL: Path = FILE.parent / 'Dll' / f'Everything{ARCH}.dll'
+CACHE_DIR: Path = FILE.parent / '.cache'
 
 POSIX_EPOCH = datetime.strptime(
     '1970-01-01 00:00:00',
@@ -131,13 +134,13 @@ class Keyboard:
     RU: LiteralString = 'ЙЦУКЕНГШЩЗФЫВАПРОЛДЯЧСМИТЬ'.lower()
     EN: LiteralString = 'QWERTYUIOPASDFGHJKLZXCVBNM'.lower()
 
-    WORD: re.Pattern[str] = re.compile('(?ui)^([{}]+)$'.format(RU))
-    CHAR: re.Pattern[str] = re.compile('(?ui)([{}])'.format(RU))
+    LETTERS: frozenset[str] = frozenset(RU)
+    TABLE: dict[int, int] = str.maketrans(RU, EN)
 
-    MAP: dict[str, str] = dict(zip(RU, EN))
-
-    IsCyrillic = staticmethod(WORD.match)
+    @classmethod
+    def IsCyrillic(cls, query: str) -> bool:
+        return bool(query) and all(char in cls.LETTERS for char in query)
 
     @classmethod
     def Translate(cls, query: str) -> str:
-        return cls.CHAR.sub(lambda x: cls.MAP[x.group(1)], query)
+        return query.translate(cls.TABLE)
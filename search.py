@@ -1,25 +1,40 @@
 import ctypes
+import os
 import os.path as op
 import re
 import struct
-from collections import Counter, defaultdict
+import sys
+from collections import defaultdict
 from collections.abc import Generator, Iterable
-from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from functools import cache
+from functools import cache, lru_cache
+from heapq import nlargest
+from itertools import compress
 from math import sqrt
+from operator import itemgetter
 from pathlib import Path
 from time import time
 from typing import TypeVar
 
-from fuzzywuzzy import fuzz, process  # pyright: ignore[reportMissingTypeStubs]
-from jellyfish import damerau_levenshtein_distance
+import numpy as np
+from diskcache import Cache
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import DamerauLevenshtein
+
+try:
+    from numba import njit
+
+except ImportError:
+    njit = None
 
 import const as cs
 
 T = TypeVar(name='T')
 
+CACHE = Cache(str(cs.CACHE_DIR), size_limit=2 ** 24)
+
 
 @dataclass
 class Answer:
@@ -42,7 +57,9 @@ if not cs.DLL.is_file():
         f"please, unpack dll's from Everything SDK to `{cs.DLL.parent}`")
 
 
-@cache
+# bounded: this would otherwise accumulate an entry for every unique
+# path the process ever answers with
+@lru_cache(maxsize=4096)
 def to_path(path: str) -> Path:
     return Path(path)
 
@@ -61,26 +78,12 @@ def unique(iterable: Iterable[T]) -> Generator[T, None, None]:
             seen.add(item)
 
 
-@cache
-def distance(x, y) -> int:
-    return damerau_levenshtein_distance(x, y)
-
-
-@cache
-def distance_relative(x, y) -> float:
-    with suppress(ZeroDivisionError):
-        return distance(x, y) / float(min(len(x), len(y)))
-    return .0
-
-
 @cache
 def get_api() -> ctypes.WinDLL:
-    return ctypes.WinDLL(cs.DLL)
-
-
-def call_everything(term: str) -> ctypes.WinDLL:
+    api = ctypes.WinDLL(cs.DLL)
 
-    api = get_api()
+    # one-time configuration: prototypes and search modes never change
+    # between queries, so don't pay ~6 ctypes round-trips per keystroke
     api.Everything_GetResultRunCount.argtypes = [
         ctypes.c_int,
         ctypes.POINTER(ctypes.c_ulonglong),
@@ -98,10 +101,6 @@ def call_everything(term: str) -> ctypes.WinDLL:
         cs.SortingCriteria.RUN_COUNT_DESCENDING.value
     )
 
-    api.Everything_SetSearchW(
-        f'file:ext:{";".join(cs.ENABLED_EXTENSIONS)} *{term}*'
-    )
-
     api.Everything_SetRequestFlags(
         cs.SearchRequest.FILE_NAME |
         cs.SearchRequest.PATH |
@@ -111,38 +110,49 @@ def call_everything(term: str) -> ctypes.WinDLL:
     return api
 
 
-@cache
+def call_everything(term: str) -> ctypes.WinDLL:
+
+    # the search string is the only per-query piece of configuration
+    api = get_api()
+
+    api.Everything_SetSearchW(
+        f'file:ext:{";".join(cs.ENABLED_EXTENSIONS)} *{term}*'
+    )
+    return api
+
+
+@lru_cache(maxsize=16384)
 def get_used_chars(x: list[str]) -> str:
     chars: tuple[str, ...] = tuple(unique(x))
     return ''.join(chars)
 
 
-@cache
-def count_missing_letters(term: str, base: str) -> int:
-    set_term = set(term)
-    common = set_term & set(base)
-    return len(set_term) - len(common)
+# every distinct character ever seen gets a bit; the working alphabet
+# (lowercase latin, digits, a little punctuation) stays well under one
+# machine word in practice
+_char_bits: dict[str, int] = {}
 
 
-@cache
-def same_start_bonus(term: str, base: str) -> int:
-    for i in range(len(term)):
-        try:
-            if term[i] != base[i]:
-                return i
-        except IndexError:
-            return i
-    return len(term)
+@lru_cache(maxsize=16384)
+def char_mask(text: str) -> int:
+    bits = _char_bits
+    mask = 0
 
+    for char in text:
+        bit = bits.get(char)
+        if bit is None:
+            bit = bits[char] = len(bits)
+        mask |= 1 << bit
 
-@cache
-def count_missing_chars_count(term: str, base: str) -> float:
-    set_term = set(term)
-    common = set_term & set(base)
-    return (len(set_term) - len(common)) / len(term)
+    return mask
+
+
+def same_start_bonus(term: str, base: str) -> int:
+    return len(op.commonprefix((term, base)))
 
 
 def get_extension(path: str) -> str:
+    # callers pass already-lowered basenames, so no extra .lower() here
     result: list[str] = []
     for char in reversed(path):
         if char in ('.', '\\', '/'):
@@ -151,23 +161,36 @@ def get_extension(path: str) -> str:
 
     if len(result) == len(path):
         return ''
-    return ''.join(reversed(result)).lower()
+    return ''.join(reversed(result))
 
 
-def its_ignored_path(path: str) -> bool:
-    lowered = path.lower()
-    if (
-        lowered.startswith(cs.WINDOWS_SXS_REPOSITORY) or
-        lowered.startswith(cs.WINDOWS_CONTAINERS_LAYERS)
-    ):
-        return True
+# a lowered path passes when it avoids the ignored roots and ends with
+# an enabled extension; one compiled pattern folds both checks into a
+# single C call per result row
+_ALLOWED_PATH = re.compile(
+    '(?!{sxs}|{layers}).*\\.(?:{extensions})$'.format(
+        sxs=re.escape(cs.WINDOWS_SXS_REPOSITORY),
+        layers=re.escape(cs.WINDOWS_CONTAINERS_LAYERS),
+        extensions='|'.join(cs.ENABLED_EXTENSIONS),
+    ),
+    re.DOTALL,
+)
+
 
-    return get_extension(lowered) not in cs.ENABLED_EXTENSIONS
+def normalize(query: str) -> str:
+    # str.split with no separator collapses any whitespace run
+    return ' '.join(query.lower().split())
 
 
-def call_dll_search(query: str) -> dict[str, list[tuple[str, int]]]:
+# result-retrieval buffers, allocated once: queries run one at a time
+# (the wox handler is single-threaded and _lookup blocks on its single
+# IPC worker), so sharing them is safe
+_INT_PTR = ctypes.c_ulonglong()
+_STR_PTR = ctypes.create_unicode_buffer(260)
+
+
+def call_dll_search(query: str) -> dict[str, list[tuple[str, str, int]]]:
 
-    query = re.sub(r'(\s+)', ' ', query.strip().lower())
     if len(query) <= cs.MIN_QUERY_LENGTH:
         return {}
 
@@ -180,27 +203,47 @@ def call_dll_search(query: str) -> dict[str, list[tuple[str, int]]]:
     result = defaultdict(list)
     result_count: int = api.Everything_GetNumResults()
 
-    # allocate buffers for retrieve result
-    int_ptr = ctypes.c_ulonglong(1)
-    str_ptr = ctypes.create_unicode_buffer(260)
-
-    for no in range(result_count):
+    # reuse the module-level retrieval buffers
+    int_ptr = _INT_PTR
+    str_ptr = _STR_PTR
 
-        # put result number to buffer
-        api.Everything_GetResultFullPathNameW(no, str_ptr, 260)
+    # bind everything the loop touches to locals: the two FFI crossings
+    # per row are unavoidable without a compiled helper, but the
+    # attribute lookups around them are not
+    get_path = api.Everything_GetResultFullPathNameW
+    get_runs = api.Everything_GetResultRunCount
+    wstring_at = ctypes.wstring_at
+    intern = sys.intern
+    allowed = _ALLOWED_PATH.match
 
-        # read string from buffer
-        path = ctypes.wstring_at(str_ptr)
+    for no in range(result_count):
 
-        # skip path, can be only executable and not in hidden folders
-        if its_ignored_path(path):
+        # put result number to buffer, then read string back; intern
+        # both strings - the same paths come back keystroke after
+        # keystroke, and interned keys hit the pointer-equality fast
+        # path in every dict and set downstream
+        get_path(no, str_ptr, 260)
+        path = intern(wstring_at(str_ptr))
+
+        # one lowered copy serves the ignore check and the basename
+        # slice below; skip hidden folders and non-executable extensions
+        lowered = path.lower()
+        if allowed(lowered) is None:
             continue
 
         # read run count from buffer
-        runs = api.Everything_GetResultRunCount(no, int_ptr)
+        runs = get_runs(no, int_ptr)
+
+        # split the row once here instead of re-deriving basename and
+        # dirname from the full path in every downstream consumer; the
+        # lowered basename is a plain slice, the dirname keeps original
+        # case minus the separator (except for drive roots)
+        cut = lowered.rfind('\\') + 1
+        dirname = path[:cut]
+        if len(dirname) > 1 and not dirname.endswith(':\\'):
+            dirname = dirname[:-1]
 
-        base = op.basename(path).lower()
-        result[base].append((path, runs))
+        result[intern(lowered[cut:])].append((path, dirname, runs))
 
     api.Everything_CleanUp()
     return dict(result)
@@ -210,151 +253,322 @@ def subsequence_match(query: str, stem: str) -> float:
     if not query:
         return 0.0
 
+    # single pass with integer bookkeeping: the positions/gaps lists of
+    # the old version only ever fed a first-element read and an average
+    length = len(query)
     query_idx = 0
-    match_positions = []
+    first_pos = -1
+    prev_pos = -1
+    gap_sum = 0
 
     for text_idx, char in enumerate(stem):
-        if query_idx < len(query) and char == query[query_idx]:
-            match_positions.append(text_idx)
+        if char == query[query_idx]:
+            if query_idx:
+                gap_sum += text_idx - prev_pos
+            else:
+                first_pos = text_idx
+
+            prev_pos = text_idx
             query_idx += 1
 
-    if query_idx != len(query):
+            if query_idx == length:
+                break
+
+    if query_idx != length:
         return 0.0
 
-    if len(match_positions) < 2:
+    if length < 2:
         density = 1.0
-
     else:
-        gaps = [
-            match_positions[i + 1] - match_positions[i]
-            for i in range(len(match_positions) - 1)
-        ]
-        avg_gap = sum(gaps) / len(gaps)
-        density = 1.0 / (1.0 + avg_gap * 0.1)
-
-    start_bonus = 1.2 if match_positions[0] == 0 else 1.0
-    length_ratio = len(query) / len(stem)
+        density = 1.0 / (1.0 + gap_sum / (length - 1) * 0.1)
+
+    start_bonus = 1.2 if first_pos == 0 else 1.0
+    length_ratio = length / len(stem)
     return density * start_bonus * (0.5 + length_ratio * 0.5)
 
 
+# everything multiplied in after the distance screen is bounded: each
+# subsequence term tops out at 1.2 (density <= 1, start bonus 1.2,
+# length factor <= 1 once the query fits inside the stem), the inverse
+# ratio boost at 100 / MIN_TOKEN_SORT_RATIO, and the remaining
+# penalties only shrink the rate
+MAX_REMAINING_GAIN = 2.4 * (100 / cs.MIN_TOKEN_SORT_RATIO)
+
+
+def score_kernel(
+    base_rate, by_match, by_chars, ss, d_prefix, missing, same_start, ratio,
+):
+    # every divisor is positive, so fold the whole chain into a single
+    # denominator and divide once; the two trailing roots merge since
+    # sqrt(a) * sqrt(b) == sqrt(a * b)
+    sq_match = np.sqrt(1 + by_match)
+    sq_chars = np.sqrt(1 + by_chars)
+
+    denominator = (
+        (sq_match + 1) * (sq_chars + 1) *
+        sq_match * sq_chars *
+        np.sqrt((1 + d_prefix) * (1 + missing)) *
+        (1 + same_start) *
+        (ratio / 100)
+    )
+
+    return base_rate * ss / denominator
+
+
+if njit is not None:
+    # optional: when numba is around, fuse the array expression into one
+    # LLVM-vectorized loop with no intermediate temporaries
+    score_kernel = njit(cache=True, fastmath=True)(score_kernel)
+
+
 def precompute_scores(
     query: str,
-    order: dict[str, list[tuple[str, int]]],
+    order: dict[str, list[tuple[str, str, int]]],
 ) -> dict[str, float]:
 
-    def sort_by_length_delta(x) -> int:
-        return abs(len(query) - len(x))
-
-    ratio = dict(
-        process.extract(
-            query,
-            sorted(order),
-            scorer=fuzz.token_sort_ratio,
-            limit=len(order),
-        )
-    )
-
-    result = {}
     length = len(query)
     chars = get_used_chars(query)
 
-    for word in sorted(order, key=sort_by_length_delta):
+    # the query side of the missing-letters test never changes inside
+    # the loop, so resolve its mask (and the cache lookup) exactly once
+    query_mask = char_mask(query)
+
+    words: list[str] = []
+    stems: list[str] = []
+    missing_counts: list[int] = []
+
+    for word in order:
         if ext := get_extension(word):
             stem = word[:-len(ext) -1]
         else:
             stem = word
 
-        if count_missing_letters(query, stem) > cs.MAX_MISSING_LETTERS:
+        missing_letters = (query_mask & ~char_mask(stem)).bit_count()
+        if missing_letters > cs.MAX_MISSING_LETTERS:
             continue
 
-        base = get_used_chars(stem)
+        words.append(word)
+        stems.append(stem)
+        missing_counts.append(missing_letters)
+
+    if not words:
+        return {}
 
-        if stem == query:
-            rate = 20.0
+    count = len(words)
+    bases = [get_used_chars(stem) for stem in stems]
 
-        elif stem.startswith(query):
-            rate = 5.0
+    # columnar per-candidate features; the scalar kernels stay cached,
+    # but the arithmetic below runs as whole-array numpy expressions
+    # instead of ~10 interpreter ops per candidate
 
-        else:
-            rate = 1.0
+    base_rate = np.fromiter(
+        (
+            20.0 if stem == query else 5.0 if stem.startswith(query) else 1.0
+            for stem in stems
+        ),
+        dtype=np.float64, count=count,
+    )
 
-        by_match = (
-            distance(query, stem) *
-            distance_relative(query, stem)
-        )
-        rate /= sqrt(1 + by_match) + 1
+    # all pairwise Damerau-Levenshtein distances in three batched C++
+    # calls instead of one python call frame per (query, candidate)
+    # pair; workers=-1 drops the GIL and spreads each batch over all
+    # cores, like the token-ratio call below
+    d_stem = process.cdist(
+        [query], stems, scorer=DamerauLevenshtein.distance, workers=-1,
+    )[0].astype(np.float64)
+
+    d_base = process.cdist(
+        [chars], bases, scorer=DamerauLevenshtein.distance, workers=-1,
+    )[0].astype(np.float64)
+
+    stem_lens = np.fromiter(
+        (len(stem) for stem in stems), dtype=np.float64, count=count)
+    base_lens = np.fromiter(
+        (len(base) for base in bases), dtype=np.float64, count=count)
+
+    min_stem = np.minimum(stem_lens, float(length))
+    min_base = np.minimum(base_lens, float(len(chars)))
+
+    by_match = d_stem * np.where(min_stem > 0, d_stem / np.maximum(min_stem, 1), .0)
+    by_chars = d_base * np.where(min_base > 0, d_base / np.maximum(min_base, 1), .0)
+
+    # staged cutoff: with only the distance screen applied, a candidate
+    # whose partial rate cannot recover past the final 0.001 threshold
+    # even with every remaining multiplier at its maximum is dead - drop
+    # it before the python-side subsequence and prefix columns are built
+    sq_match = np.sqrt(1 + by_match)
+    sq_chars = np.sqrt(1 + by_chars)
+    partial = base_rate / ((sq_match + 1) * (sq_chars + 1) * sq_match * sq_chars)
+
+    keep = partial * MAX_REMAINING_GAIN > 0.001
+    if not keep.all():
+        words = list(compress(words, keep))
+        stems = list(compress(stems, keep))
+        bases = list(compress(bases, keep))
+        missing_counts = list(compress(missing_counts, keep))
+
+        base_rate = base_rate[keep]
+        by_match = by_match[keep]
+        by_chars = by_chars[keep]
+        count = len(words)
+
+        if not count:
+            return {}
+
+    d_prefix = process.cdist(
+        [query], [stem[:length] for stem in stems],
+        scorer=DamerauLevenshtein.distance, workers=-1,
+    )[0].astype(np.float64)
+
+    ss = np.fromiter(
+        (
+            subsequence_match(query, stem) + subsequence_match(chars, base)
+            for stem, base in zip(stems, bases)
+        ),
+        dtype=np.float64, count=count,
+    )
 
-        by_chars = (
-            distance(chars, base) *
-            distance_relative(chars, base)
-        )
-        rate /= sqrt(1 + by_chars) + 1
+    # the missing-chars penalty is just the filter-pass letter count
+    # scaled by the query length - no second kernel pass needed
+    missing = np.fromiter(
+        missing_counts, dtype=np.float64, count=count,
+    ) / length
 
-        rate *= (
-            subsequence_match(query, stem) +
-            subsequence_match(chars, base)
-        )
+    same_start = np.fromiter(
+        (same_start_bonus(query, stem) for stem in stems),
+        dtype=np.float64, count=count,
+    )
+
+    # one batched C++ call over the whole candidate list instead of a
+    # python-level loop with per-pair scorer dispatch; for the first few
+    # keystrokes - exactly when the candidate set is largest - the token
+    # ratio is near-noise, so skip it and let it score as neutral
+    if length <= cs.SHORT_QUERY_LENGTH:
+        ratio = np.full(count, 100.0)
+    else:
+        # the cutoff lets rapidfuzz bail out of hopeless pairs early;
+        # pairs below it come back as 0 and are floored to the cutoff,
+        # which also caps the boost the divisor gives to weak matches.
+        # workers=-1 releases the GIL and fans the row out over all
+        # cores, and asking for float64 up front skips a convert pass
+        ratio = process.cdist(
+            [query], words,
+            scorer=fuzz.token_sort_ratio,
+            score_cutoff=cs.MIN_TOKEN_SORT_RATIO,
+            dtype=np.float64,
+            workers=-1,
+        )[0]
+
+    rate = score_kernel(
+        base_rate, by_match, by_chars, ss, d_prefix, missing, same_start,
+        np.maximum(ratio, float(cs.MIN_TOKEN_SORT_RATIO)),
+    )
 
-        rate /= sqrt(1 + by_chars) * sqrt(1 + by_match)
+    # compress keeps the interned key objects from ingest; a numpy
+    # string array here would hand back fresh un-interned copies
+    mask = rate > 0.001
+    return dict(zip(compress(words, mask), rate[mask].tolist()))
 
-        rate /= sqrt(1 + distance(query, stem[:length]))
 
-        rate /= sqrt(1 + count_missing_chars_count(query, stem))
+STAT_TTL = 3.0  # seconds, enough to cover one typing burst
+STAT_CACHE_LIMIT = 4096  # prune expired entries past this size
 
-        rate /= 1 + same_start_bonus(query, stem)
+_stat_cache: dict[str, tuple[float, tuple[int, int] | None]] = {}
 
-        rate /= float(ratio.get(word, 1)) / 100
+# os.stat releases the GIL, so the per-candidate checks overlap almost
+# linearly; individual dict stores are atomic under the GIL, a racing
+# duplicate stat only wastes one syscall
+_STAT_POOL = ThreadPoolExecutor(max_workers=16)
 
-        if rate <= 0.001:
-            continue
 
-        result[word] = rate
+def stat_key(full: str) -> tuple[int, int] | None:
+    # (inode, device) uniquely identifies a file; on windows this opens
+    # a handle, so remember the answer for a few seconds of keystrokes
+    now = time()
 
-    return result
+    cached = _stat_cache.get(full)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    try:
+        stat = os.stat(full)
+        key = stat.st_ino, stat.st_dev
+    except OSError:
+        key = None
+
+    # bounded like the other string-keyed caches: once the dict grows
+    # past the limit, sweep out everything already expired (pop instead
+    # of del - the warm-up pool may race another sweep); with a 3s TTL
+    # a sweep that frees nothing means the cache was reloaded within
+    # one burst, so start over rather than grow without bound
+    if len(_stat_cache) >= STAT_CACHE_LIMIT:
+        for stale, (deadline, _) in list(_stat_cache.items()):
+            if deadline <= now:
+                _stat_cache.pop(stale, None)
+
+        if len(_stat_cache) >= STAT_CACHE_LIMIT:
+            _stat_cache.clear()
+
+    _stat_cache[full] = (now + STAT_TTL, key)
+    return key
 
 
 def postprocess_scoring(
-    order: dict[str, list[tuple[str, int]]],
+    order: dict[str, list[tuple[str, str, int]]],
     scores: dict[str, float],
 ) -> tuple[Answer, ...]:
-    result = defaultdict(list)
+
+    # combine scores in pure python first; only the best slice can make
+    # the answer, so the long tail is never worth a stat syscall
+    candidates = nlargest(
+        cs.MAX_RESULTS_COUNT * 2,
+        (
+            (sqrt(runs + 1) * sqrt(score + 1), runs, full, dirname)
+            for stem, score in scores.items()
+            for full, dirname, runs in order[stem]
+        ),
+    )
+
+    # warm the stat cache for the whole slice in parallel instead of
+    # paying the syscalls one by one in the dedup loop below
+    if len(candidates) > 1:
+        for _ in _STAT_POOL.map(stat_key, (row[2] for row in candidates)):
+            pass
 
     runstat = {}
     scoring = {}
     mapping = defaultdict(list)
 
-    for stem, score in scores.items():
-        for full, runs in order[stem]:
-            path = to_path(full)
+    for combined, runs, full, dirname in candidates:
 
-            # check file existence and have permissions
-            try:
-                stat = path.stat()
-            except Exception:
-                continue
+        # check file existence and have permissions
+        key = stat_key(full)
+        if key is None:
+            continue
 
-            # use (inode, device) as unique file identifier
-            key = stat.st_ino, stat.st_dev
-            mapping[key].append(full)
+        mapping[key].append((full, dirname))
 
-            if key not in scoring:
-                runstat[key] = runs
-                scoring[key] = sqrt(runs + 1) * sqrt(score + 1)
+        if key not in scoring:
+            runstat[key] = runs
+            scoring[key] = combined
 
     # lock mapping to avoid changes during missing __getitem__
     mapping = dict(mapping)
 
     result = []
-    for key, score in Counter(scoring).most_common(cs.MAX_RESULTS_COUNT):
+    for key, score in nlargest(
+        cs.MAX_RESULTS_COUNT, scoring.items(), key=itemgetter(1),
+    ):
 
         # take the shortest path from duplicates
-        path = to_path(sorted(mapping[key], key=len)[0])
+        full, dirname = min(mapping[key], key=lambda row: len(row[0]))
+        path = to_path(full)
 
         # finally, prepare the answer
         result.append(
             Answer(
                 path=path,
-                dir=path.parent,
+                dir=to_path(dirname),
                 stem=path.stem,
                 runs=runstat[key],
                 score=score,
@@ -364,8 +578,46 @@ def postprocess_scoring(
     return tuple(result)
 
 
+# candidates of the previous query; a query that extends it can only
+# narrow this set, so we re-filter in-process instead of asking
+# Everything again on every keystroke
+_last: dict = {'prefix': '', 'order': None}
+
+# single worker for the Everything IPC: ctypes releases the GIL for the
+# duration of the foreign call, so scoring preparation can overlap it
+_POOL = ThreadPoolExecutor(max_workers=1)
+
+
 def _lookup(query: str) -> tuple[Answer, ...]:
-    order = call_dll_search(query)
+    order = None
+
+    if (
+        _last['order'] is not None and
+        len(query) > len(_last['prefix']) and
+        query.startswith(_last['prefix'])
+    ):
+        subsequence = query.replace(' ', '')
+        order = {
+            word: rows
+            for word, rows in _last['order'].items()
+            if subsequence_match(subsequence, word) > .0
+        }
+
+    if order is None:
+        future = _POOL.submit(call_dll_search, query)
+
+        # warm the query-side caches while the reply is in flight
+        get_used_chars(query)
+
+        order = future.result()
+
+    if len(query) > cs.MIN_QUERY_LENGTH:
+        _last['prefix'] = query
+        _last['order'] = order
+    else:
+        _last['prefix'] = ''
+        _last['order'] = None
+
     if not order:
         return ()
 
@@ -377,11 +629,24 @@ def _lookup(query: str) -> tuple[Answer, ...]:
 def lookup(query: str) -> tuple[Answer, ...]:
     if cs.Keyboard.IsCyrillic(query):
         query = cs.Keyboard.Translate(query)
-    return _lookup(query)
+
+    query = normalize(query)
+
+    # repeated queries (typing back and forth) hit the disk cache
+    # instead of a full Everything round-trip + rescoring
+    if (answer := CACHE.get(query)) is not None:
+        return answer
+
+    answer = _lookup(query)
+    CACHE.set(query, answer, expire=cs.CACHE_TTL)
+    return answer
 
 
 def increment(path: str) -> None:
-    path = re.sub(r'(\\+)', r'\\', path)
+    # collapse doubled backslashes; each pass halves a run, so this
+    # terminates after a couple of iterations on real paths
+    while '\\\\' in path:
+        path = path.replace('\\\\', '\\')
 
     api = get_api()
     api.Everything_IncRunCountFromFileNameW(path)